@@ -0,0 +1,48 @@
+"""Narrow VARCHAR lengths
+
+Revision ID: c8f1d2a47b6e
+Revises: 75d2435427ce
+Create Date: 2026-09-01 10:12:05.118244
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f1d2a47b6e'
+down_revision: Union[str, Sequence[str], None] = '75d2435427ce'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_NARROWED = [
+    ('countries', 'name', 100, 64),
+    ('countries', 'code', 10, 3),
+    ('clubs', 'name', 100, 64),
+    ('clubs', 'country', 100, 64),
+    ('clubs', 'league', 100, 64),
+    ('competitions', 'name', 100, 64),
+    ('competitions', 'country', 100, 64),
+    ('players', 'name', 100, 64),
+    ('players', 'club', 100, 64),
+    ('matches', 'home_team', 100, 64),
+    ('matches', 'away_team', 100, 64),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, old, new in _NARROWED:
+        op.alter_column(table, column,
+                        existing_type=sa.String(length=old),
+                        type_=sa.String(length=new))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, old, new in _NARROWED:
+        op.alter_column(table, column,
+                        existing_type=sa.String(length=new),
+                        type_=sa.String(length=old))
@@ -1,12 +1,23 @@
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from api.routes import players  # import other routers similarly
 from database.session import engine
 from models.base import Base
 
-# Create tables in dev/test environments
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # DDL once per process, off the import path; disable in production where
+    # Alembic owns the schema.
+    if os.getenv("CREATE_TABLES_ON_STARTUP", "1") == "1":
+        await run_in_threadpool(Base.metadata.create_all, engine)
+    yield
 
-app = FastAPI(title="Soccer Data API")
+app = FastAPI(title="Soccer Data API", lifespan=lifespan,
+              default_response_class=ORJSONResponse)
 
 app.include_router(players.router, prefix="/players", tags=["Players"])
 
@@ -1,14 +1,14 @@
 from fastapi import APIRouter, HTTPException
+from api.routes.fast_route import FastAdapterRoute
 from api.schemas.schemas import Country
 from database.sqlite_connection import db_manager
 
-router = APIRouter()
+router = APIRouter(route_class=FastAdapterRoute)
 
 @router.get("/", response_model=list[Country])
 def get_all_countries():
-    query = "SELECT * FROM countries"
+    query = "SELECT id, name, code FROM countries"
     try:
-        df = db_manager.execute_query(query)
-        return df.to_dict(orient="records")
+        return db_manager.execute_rows(query)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
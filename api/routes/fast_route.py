@@ -0,0 +1,42 @@
+import asyncio
+from functools import wraps
+from typing import Any, Callable
+
+from fastapi import Response
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+
+
+class FastAdapterRoute(APIRoute):
+    """APIRoute that serializes responses through a TypeAdapter built once.
+
+    FastAPI normally re-validates the response_model and walks the result with
+    jsonable_encoder on every request. This route class builds the adapter at
+    registration time, binds it into the endpoint closure and returns the
+    dumped JSON bytes directly.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, *, response_model: Any = None, **kwargs):
+        if response_model is not None:
+            endpoint = _wrap_endpoint(endpoint, TypeAdapter(response_model))
+            response_model = None
+        super().__init__(path, endpoint, response_model=response_model, **kwargs)
+
+
+def _wrap_endpoint(endpoint: Callable, adapter: TypeAdapter) -> Callable:
+    if asyncio.iscoroutinefunction(endpoint):
+        @wraps(endpoint)
+        async def wrapped(*args, **kwargs):
+            return _dump(adapter, await endpoint(*args, **kwargs))
+    else:
+        @wraps(endpoint)
+        def wrapped(*args, **kwargs):
+            return _dump(adapter, endpoint(*args, **kwargs))
+    return wrapped
+
+
+def _dump(adapter: TypeAdapter, result: Any) -> Response:
+    if isinstance(result, Response):
+        return result
+    payload = adapter.dump_json(adapter.validate_python(result, from_attributes=True))
+    return Response(content=payload, media_type="application/json")
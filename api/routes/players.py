@@ -1,19 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Response
+from pydantic import TypeAdapter
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from database.deps import get_db
 from models.players import Player
-from api.schemas.player_schema import PlayerIn, PlayerOut
+from api.schemas.schemas import PlayerIn, PlayerOut
 
 router = APIRouter()
 
-@router.get("/", response_model=list[PlayerOut])
+# Built once at import time; rebuilding a TypeAdapter per request would redo
+# the pydantic-core schema compilation on the hot path.
+_players_adapter = TypeAdapter(list[PlayerOut])
+
+@router.get("/")
 def list_players(db: Session = Depends(get_db)):
-    return db.query(Player).limit(100).all()
+    rows = db.query(Player).limit(100).all()
+    payload = _players_adapter.dump_json(_players_adapter.validate_python(rows))
+    return Response(content=payload, media_type="application/json")
 
 @router.post("/", response_model=PlayerOut)
 def create_player(player: PlayerIn, db: Session = Depends(get_db)):
-    db_player = Player(**player.dict())
-    db.add(db_player)
+    # INSERT ... RETURNING: one round-trip instead of commit + refresh SELECT
+    stmt = insert(Player).values(**player.model_dump()).returning(Player)
+    db_player = db.scalars(stmt).one()
     db.commit()
-    db.refresh(db_player)
     return db_player
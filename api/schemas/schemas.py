@@ -1,15 +1,37 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 class Country(BaseModel):
-    id: Optional[int]
+    model_config = ConfigDict(defer_build=True)
+
+    id: Optional[int] = None
+    name: str
+    code: Optional[str] = None
+
+class PlayerBase(BaseModel):
+    """Single source of truth for player fields; variants only adjust ids/constraints."""
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
+            "examples": [{"name": "Kylian Mbappé", "age": 25, "club": "Paris Saint-Germain"}]
+        },
+    )
+
     name: str
-    code: Optional[str]
+    age: Optional[int] = None
+    club: Optional[str] = None
+
+class PlayerIn(PlayerBase):
+    pass
+
+class PlayerCreate(PlayerBase):
+    age: int = Field(..., gt=0)
+    club: str
+
+class PlayerOut(PlayerBase):
+    id: int
 
-class PlayerCreate(BaseModel):
-    name: str = Field(..., example="Kylian Mbappé")
-    age: int = Field(..., gt=0, example=25)
-    club: str = Field(..., example="Paris Saint-Germain")
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 class Player(PlayerCreate):
-    id: Optional[int]
+    id: Optional[int] = None
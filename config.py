@@ -15,6 +15,11 @@ class Settings(BaseSettings):
     LOG_TO_FILE: bool = Field(default=False)
     LOG_FILE_NAME: Path = Path("logs/scraper.log")
 
+    EXPORT_DIR: Path = Path("data/exports")
+
+    # Backend SQLite (utilisé quand USE_SQLITE=1)
+    DATABASE_PATH: Path = Path("data/soccer.db")
+
 settings = Settings()
 
 # Pour accès direct dans vos modules
@@ -23,3 +28,5 @@ LOG_LEVEL      = settings.LOG_LEVEL
 LOG_TO_CONSOLE = settings.LOG_TO_CONSOLE
 LOG_TO_FILE    = settings.LOG_TO_FILE
 LOG_FILE_NAME  = settings.LOG_FILE_NAME
+EXPORT_DIR     = settings.EXPORT_DIR
+DATABASE_PATH  = settings.DATABASE_PATH
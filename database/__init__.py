@@ -0,0 +1,13 @@
+import os
+
+def get_db_manager():
+    """Return the configured backend's manager.
+
+    Imports are deferred so the non-selected stack (pandas/sqlite3 vs
+    SQLAlchemy/psycopg2) never loads at worker startup.
+    """
+    if os.getenv("USE_SQLITE") == "1":
+        from database.sqlite_connection import db_manager
+    else:
+        from database.postgres_connection import db_manager
+    return db_manager
@@ -1,15 +1,30 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, scoped_session
+import io
+from functools import lru_cache
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
 import pandas as pd
 from config import DATABASE_URL
 from models.base import Base
 from models import countries, competitions, clubs, players, matches  # Assurez-vous que tous les modèles sont importés
 
-# Créer l'engine PostgreSQL
-engine = create_engine(DATABASE_URL, echo=False)
+# Créer l'engine PostgreSQL avec un vrai pool de connexions
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    echo=False,
+)
 
-# Créer une session
-SessionLocal = scoped_session(sessionmaker(bind=engine))
+# Créer une session (une par requête via get_db, pas de scoped_session)
+SessionLocal = sessionmaker(bind=engine)
+
+@lru_cache(maxsize=256)
+def _compile(query: str):
+    """TextClause mis en cache : les requêtes répétées ne sont pas re-parsées."""
+    return text(query)
 
 class PostgresDBManager:
     def __init__(self):
@@ -18,29 +33,67 @@ class PostgresDBManager:
 
     def execute_query(self, query: str) -> pd.DataFrame:
         """Exécute une requête SQL et retourne un DataFrame."""
-        with self.engine.connect() as connection:
-            result = connection.execute(text(query))
-            df = pd.DataFrame(result.fetchall(), columns=result.keys())
-            return df
+        # read_sql_query construit le DataFrame directement depuis le curseur,
+        # sans listes Python intermédiaires (fetchall)
+        return pd.read_sql_query(_compile(query), self.engine)
+
+    def execute_query_chunked(self, query: str, chunksize: int = 10000):
+        """Itère le résultat par morceaux de DataFrame, à mémoire constante."""
+        with self.engine.connect().execution_options(stream_results=True) as connection:
+            yield from pd.read_sql_query(_compile(query), connection, chunksize=chunksize)
 
     def get_table_stats(self) -> dict:
         """Retourne le nombre de lignes pour les tables principales."""
-        stats = {}
         tables = ['countries', 'competitions', 'clubs', 'players', 'matches']
-        for table in tables:
-            try:
-                df = self.execute_query(f"SELECT COUNT(*) AS count FROM {table}")
-                stats[table] = int(df.iloc[0]['count'])
-            except Exception:
-                stats[table] = 'error'
-        return stats
+        query = " UNION ALL ".join(
+            f"SELECT '{table}' AS t, COUNT(*) AS n FROM {table}" for table in tables
+        )
+        try:
+            with self.engine.connect() as connection:
+                result = connection.execute(_compile(query))
+                return {row[0]: int(row[1]) for row in result}
+        except Exception:
+            return {table: 'error' for table in tables}
 
     def bulk_insert_players(self, data: list[tuple]):
         """Insère une liste de joueurs [(name, age, club_name), ...]"""
-        with self.Session() as session:
-            for name, age, club in data:
-                session.add(players.Player(name=name, age=age, club=club))
-            session.commit()
+        data = list(data)
+        if not data:
+            return
+        try:
+            self._copy_players(data)
+        except (AttributeError, NotImplementedError):
+            # Driver sans copy_expert : retombe sur le chemin Core
+            rows = [{"name": name, "age": age, "club": club} for name, age, club in data]
+            with self.engine.begin() as conn:
+                conn.execute(insert(players.Player.__table__), rows)
+
+    def _copy_players(self, data: list[tuple]):
+        """COPY FROM STDIN : le chemin d'ingestion le plus rapide de Postgres,
+        une passe réseau au lieu d'un executemany ligne par ligne."""
+        buffer = io.StringIO()
+        for name, age, club in data:
+            # Format texte de COPY : backslash, tabulations et fins de ligne
+            # (\n comme \r) doivent être échappés
+            name = (str(name).replace('\\', '\\\\').replace('\t', '\\t')
+                    .replace('\n', '\\n').replace('\r', '\\r'))
+            club = (str(club).replace('\\', '\\\\').replace('\t', '\\t')
+                    .replace('\n', '\\n').replace('\r', '\\r'))
+            buffer.write(f"{name}\t{int(age)}\t{club}\n")
+        buffer.seek(0)
+        raw = self.engine.raw_connection()
+        try:
+            with raw.cursor() as cursor:
+                cursor.copy_expert(
+                    "COPY players (name, age, club) FROM STDIN WITH (FORMAT text)",
+                    buffer,
+                )
+            raw.commit()
+        except Exception:
+            raw.rollback()
+            raise
+        finally:
+            raw.close()
 
 # Initialise les tables (à exécuter une seule fois si non gérées par Alembic)
 def init_database():
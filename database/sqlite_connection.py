@@ -1,7 +1,17 @@
+import csv
 import sqlite3
+import sys
+import threading
+from itertools import chain, islice
 import pandas as pd
 import json
 from pathlib import Path
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 from typing import Optional
 from loguru import logger
 from config import DATABASE_PATH
@@ -10,17 +20,48 @@ from core.exceptions import DatabaseConnectionError
 EXPORT_DIR = Path("data/exports")
 EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Constant SQL text so SQLite's statement cache reuses the compiled bytecode
+INSERT_PLAYER_SQL = "INSERT INTO players (name, age, club) VALUES (?, ?, ?)"
+
+# 3 binds per row keeps full chunks well under SQLite's 999-parameter cap
+MULTI_INSERT_MAX_ROWS = 300
+
+TRACKED_TABLES = ('countries', 'competitions', 'clubs', 'players', 'matches')
+
 class SQLiteManager:
     def __init__(self, db_path: str = str(DATABASE_PATH)):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.connection = None
+        # One connection per thread; WAL lets readers run concurrently instead
+        # of contending on a single shared handle.
+        self._local = threading.local()
+        # Column-name tuples per SELECT, so repeat queries skip cursor.description
+        self._columns_cache: dict[str, tuple] = {}
         self.connect()
 
+    def _open_connection(self) -> sqlite3.Connection:
+        # detect_types=0: hand DATE/TIMESTAMP columns through as ISO-8601 text
+        # instead of paying the converter-registry lookup per column
+        connection = sqlite3.connect(str(self.db_path), detect_types=0)
+        connection.row_factory = sqlite3.Row
+        # WAL + NORMAL sync: one fsync per transaction instead of per write
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        connection.execute("PRAGMA cache_size=-65536")
+        return connection
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._open_connection()
+            self._local.connection = connection
+        return connection
+
     def connect(self):
         try:
-            self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
-            self.connection.row_factory = sqlite3.Row
+            self._local.connection = self._open_connection()
             logger.info(f"Connected to SQLite database: {self.db_path}")
         except Exception as e:
             logger.error(f"Failed to connect to SQLite database: {e}")
@@ -134,18 +175,44 @@ class SQLiteManager:
 
         -- Indexes
         CREATE INDEX IF NOT EXISTS idx_players_name ON players(name);
+        CREATE INDEX IF NOT EXISTS idx_players_club ON players(club);
         CREATE INDEX IF NOT EXISTS idx_clubs_name ON clubs(name);
         CREATE INDEX IF NOT EXISTS idx_matches_date ON matches(match_date);
         """
         try:
             cursor = self.connection.cursor()
             cursor.executescript(schema_sql)
+            cursor.executescript(self._counter_sql())
             self.connection.commit()
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Error creating tables: {e}")
             raise
 
+    @staticmethod
+    def _counter_sql() -> str:
+        """DDL for the row-counter table and its maintenance triggers.
+
+        COUNT(*) is a full scan in SQLite, so stats reads come from
+        table_counts instead; the triggers keep it exact on every
+        insert/delete for a tiny per-write cost.
+        """
+        parts = ["CREATE TABLE IF NOT EXISTS table_counts (name TEXT PRIMARY KEY, n INTEGER NOT NULL);"]
+        for table in TRACKED_TABLES:
+            parts.append(
+                f"INSERT OR REPLACE INTO table_counts(name, n) "
+                f"SELECT '{table}', COUNT(*) FROM {table};"
+            )
+            parts.append(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_count_ai AFTER INSERT ON {table} "
+                f"BEGIN UPDATE table_counts SET n = n + 1 WHERE name = '{table}'; END;"
+            )
+            parts.append(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_count_ad AFTER DELETE ON {table} "
+                f"BEGIN UPDATE table_counts SET n = n - 1 WHERE name = '{table}'; END;"
+            )
+        return "\n".join(parts)
+
     def execute_query(self, query: str, params: Optional[dict] = None) -> pd.DataFrame:
         try:
             return pd.read_sql_query(query, self.connection, params=params)
@@ -153,6 +220,19 @@ class SQLiteManager:
             logger.error(f"Error executing query: {e}")
             raise
 
+    def execute_rows(self, query: str, params: Optional[tuple] = None) -> list[dict]:
+        """Run a SELECT and return plain dicts, skipping the DataFrame detour."""
+        try:
+            cursor = self.connection.execute(query, params or ())
+            columns = self._columns_cache.get(query)
+            if columns is None:
+                columns = tuple(sys.intern(d[0]) for d in cursor.description)
+                self._columns_cache[query] = columns
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"Error executing query: {e}")
+            raise
+
     def insert_dataframe(self, df: pd.DataFrame, table_name: str, if_exists: str = 'append'):
         try:
             df.to_sql(table_name, self.connection, if_exists=if_exists, index=False)
@@ -162,59 +242,139 @@ class SQLiteManager:
             raise
 
     def bulk_insert_players(self, players_data):
+        # BEGIN IMMEDIATE takes the write lock up front, so the whole batch is
+        # one transaction (one fsync under WAL) with no mid-batch lock upgrade
         try:
-            with self.connection:
-                self.connection.executemany(
-                    "INSERT INTO players (name, age, club) VALUES (?, ?, ?)",
-                    players_data
-                )
-            logger.info(f"✅ Bulk inserted {len(players_data)} players.")
+            rows = iter(players_data)
+            total = 0
+            cursor = self.connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                while True:
+                    chunk = list(islice(rows, MULTI_INSERT_MAX_ROWS))
+                    if not chunk:
+                        break
+                    # Multi-row VALUES: one prepare/step per ~300 rows instead
+                    # of one per row; full chunks share the same SQL text
+                    sql = INSERT_PLAYER_SQL + ",(?, ?, ?)" * (len(chunk) - 1)
+                    cursor.execute(sql, list(chain.from_iterable(chunk)))
+                    total += len(chunk)
+                self.connection.commit()
+            except Exception:
+                self.connection.rollback()
+                raise
+            logger.info(f"✅ Bulk inserted {total} players.")
         except Exception as e:
             logger.error(f"❌ Bulk insert failed: {e}")
 
     def get_table_stats(self) -> dict:
-        tables = ['countries', 'competitions', 'clubs', 'players', 'matches']
-        stats = {}
-        for table in tables:
-            try:
-                cursor = self.connection.cursor()
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                stats[table] = cursor.fetchone()[0]
-            except:
-                stats[table] = 0
-        return stats
+        try:
+            cursor = self.connection.execute("SELECT name, n FROM table_counts")
+            stats = {row[0]: row[1] for row in cursor.fetchall()}
+            if stats:
+                return stats
+        except Exception:
+            pass
+        # Counter table absent (pre-migration DB): fall back to one scan pass
+        query = " UNION ALL ".join(
+            f"SELECT '{table}' AS t, COUNT(*) AS n FROM {table}" for table in TRACKED_TABLES
+        )
+        try:
+            cursor = self.connection.execute(query)
+            return {row[0]: row[1] for row in cursor.fetchall()}
+        except Exception:
+            return {table: 0 for table in TRACKED_TABLES}
 
     def export_table_to_csv(self, table_name: str):
-        df = self.execute_query(f"SELECT * FROM {table_name}")
-        if not df.empty:
-            path = EXPORT_DIR / f"{table_name}.csv"
-            df.to_csv(path, index=False)
-            logger.info(f"✅ Exported {table_name} to CSV → {path}")
-        else:
+        cursor = self.connection.execute(f"SELECT * FROM {table_name}")
+        first_row = cursor.fetchone()
+        if first_row is None:
             logger.warning(f"⚠️ No data to export from {table_name}")
+            return
+        path = EXPORT_DIR / f"{table_name}.csv"
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow([d[0] for d in cursor.description])
+            writer.writerow(tuple(first_row))
+            writer.writerows(cursor)
+        logger.info(f"✅ Exported {table_name} to CSV → {path}")
 
     def export_table_to_json(self, table_name: str):
-        df = self.execute_query(f"SELECT * FROM {table_name}")
-        if not df.empty:
-            path = EXPORT_DIR / f"{table_name}.json"
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(df.to_dict(orient="records"), f, ensure_ascii=False, indent=2)
-            logger.info(f"✅ Exported {table_name} to JSON → {path}")
-        else:
+        rows = self.execute_rows(f"SELECT * FROM {table_name}")
+        if not rows:
             logger.warning(f"⚠️ No data to export from {table_name}")
+            return
+        path = EXPORT_DIR / f"{table_name}.json"
+        if ORJSON_AVAILABLE:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(rows, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(rows, f, ensure_ascii=False, indent=2)
+        logger.info(f"✅ Exported {table_name} to JSON → {path}")
 
     def export_table_to_excel(self, table_name: str):
         df = self.execute_query(f"SELECT * FROM {table_name}")
         if not df.empty:
             path = EXPORT_DIR / f"{table_name}.xlsx"
-            df.to_excel(path, index=False)
+            # constant_memory keeps one row in RAM instead of the whole sheet
+            with pd.ExcelWriter(path, engine="xlsxwriter",
+                                engine_kwargs={"options": {"constant_memory": True}}) as writer:
+                df.to_excel(writer, index=False)
             logger.info(f"✅ Exported {table_name} to Excel → {path}")
         else:
             logger.warning(f"⚠️ No data to export from {table_name}")
 
+    def export_table_to_parquet(self, table_name: str, batch_size: int = 10000):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # One explicit schema from the declared column types: per-batch type
+        # inference breaks when a nullable column is all-NULL in one chunk
+        # but typed in another, and a fixed schema lets each batch stream
+        # straight to disk instead of piling up in memory
+        fields = []
+        for col in self.connection.execute(f"PRAGMA table_info({table_name})"):
+            decl = (col["type"] or "").upper()
+            if "INT" in decl:
+                arrow_type = pa.int64()
+            elif "REAL" in decl or "FLOA" in decl or "DOUB" in decl:
+                arrow_type = pa.float64()
+            else:
+                arrow_type = pa.string()
+            fields.append(pa.field(col["name"], arrow_type))
+        schema = pa.schema(fields)
+
+        cursor = self.connection.execute(f"SELECT * FROM {table_name}")
+        path = EXPORT_DIR / f"{table_name}.parquet"
+        writer = None
+        total = 0
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                if writer is None:
+                    writer = pq.ParquetWriter(path, schema, compression="zstd")
+                arrays = [
+                    pa.array([row[i] for row in rows], type=field.type)
+                    for i, field in enumerate(schema)
+                ]
+                writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+                total += len(rows)
+        finally:
+            if writer is not None:
+                writer.close()
+        if not total:
+            logger.warning(f"⚠️ No data to export from {table_name}")
+            return
+        logger.info(f"✅ Exported {table_name} to Parquet → {path}")
+
     def close(self):
-        if self.connection:
-            self.connection.close()
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
             logger.info("Database connection closed")
 
 # Global instance
@@ -228,33 +388,43 @@ def init_database():
 def generate_sample_data():
     logger.info("Generating sample data...")
 
-    countries_df = pd.DataFrame([
-        {'name': 'England', 'code': 'ENG'},
-        {'name': 'Spain', 'code': 'ESP'},
-        {'name': 'Germany', 'code': 'GER'},
-        {'name': 'Italy', 'code': 'ITA'},
-        {'name': 'France', 'code': 'FRA'},
-        {'name': 'Brazil', 'code': 'BRA'},
-        {'name': 'Argentina', 'code': 'ARG'},
-    ])
-    db_manager.insert_dataframe(countries_df, 'countries', if_exists='replace')
-
-    competitions_df = pd.DataFrame([
-        {'name': 'Premier League', 'country_id': 1, 'type': 'league', 'tier': 1, 'season': '2023-24'},
-        {'name': 'La Liga', 'country_id': 2, 'type': 'league', 'tier': 1, 'season': '2023-24'},
-        {'name': 'Bundesliga', 'country_id': 3, 'type': 'league', 'tier': 1, 'season': '2023-24'},
-        {'name': 'Serie A', 'country_id': 4, 'type': 'league', 'tier': 1, 'season': '2023-24'},
-        {'name': 'Ligue 1', 'country_id': 5, 'type': 'league', 'tier': 1, 'season': '2023-24'},
-    ])
-    db_manager.insert_dataframe(competitions_df, 'competitions', if_exists='replace')
-
-    clubs_df = pd.DataFrame([
-        {'name': 'Manchester City', 'short_name': 'Man City', 'country_id': 1, 'city': 'Manchester'},
-        {'name': 'Real Madrid', 'short_name': 'Real Madrid', 'country_id': 2, 'city': 'Madrid'},
-        {'name': 'Bayern Munich', 'short_name': 'Bayern', 'country_id': 3, 'city': 'Munich'},
-        {'name': 'AC Milan', 'short_name': 'Milan', 'country_id': 4, 'city': 'Milan'},
-        {'name': 'Paris Saint-Germain', 'short_name': 'PSG', 'country_id': 5, 'city': 'Paris'},
-    ])
-    db_manager.insert_dataframe(clubs_df, 'clubs', if_exists='replace')
+    countries = [
+        ('England', 'ENG'),
+        ('Spain', 'ESP'),
+        ('Germany', 'GER'),
+        ('Italy', 'ITA'),
+        ('France', 'FRA'),
+        ('Brazil', 'BRA'),
+        ('Argentina', 'ARG'),
+    ]
+    competitions = [
+        ('Premier League', 1, 'league', 1, '2023-24'),
+        ('La Liga', 2, 'league', 1, '2023-24'),
+        ('Bundesliga', 3, 'league', 1, '2023-24'),
+        ('Serie A', 4, 'league', 1, '2023-24'),
+        ('Ligue 1', 5, 'league', 1, '2023-24'),
+    ]
+    clubs = [
+        ('Manchester City', 'Man City', 1, 'Manchester'),
+        ('Real Madrid', 'Real Madrid', 2, 'Madrid'),
+        ('Bayern Munich', 'Bayern', 3, 'Munich'),
+        ('AC Milan', 'Milan', 4, 'Milan'),
+        ('Paris Saint-Germain', 'PSG', 5, 'Paris'),
+    ]
+
+    # One transaction, one executemany per table — no pandas to_sql in the way
+    connection = db_manager.connection
+    with connection:
+        connection.execute("DELETE FROM countries")
+        connection.executemany(
+            "INSERT INTO countries (name, code) VALUES (?, ?)", countries)
+        connection.execute("DELETE FROM competitions")
+        connection.executemany(
+            "INSERT INTO competitions (name, country_id, type, tier, season) VALUES (?, ?, ?, ?, ?)",
+            competitions)
+        connection.execute("DELETE FROM clubs")
+        connection.executemany(
+            "INSERT INTO clubs (name, short_name, country_id, city) VALUES (?, ?, ?, ?)",
+            clubs)
 
     logger.info("Sample data generated successfully")
@@ -1,265 +1,11 @@
-# #!/usr/bin/env python3
-# """
-# Simplified Soccer Data Scraper Main Application
-# """
-
-# import sys
-# from pathlib import Path
-# import pandas as pd
-# import asyncio
-# from config import LOG_FILE_NAME, LOG_LEVEL, LOG_TO_CONSOLE, LOG_TO_FILE
-
-# sys.path.append(str(Path(__file__).parent))
-
-# try:
-#     from loguru import logger
-#     from database.sqlite_connection import db_manager, init_database, generate_sample_data
-#     LOGURU_AVAILABLE = True
-# except ImportError:
-#     LOGURU_AVAILABLE = False
-#     import logging
-#     logging.basicConfig(level=logging.INFO)
-#     logger = logging.getLogger(__name__)
-
-# from scrapers.async_scraper import AsyncSoccerScraper
-
-# def setup_logging():
-#     """Configure logging"""
-#     if LOGURU_AVAILABLE:
-#         logger.remove()
-#         if LOG_TO_CONSOLE:
-#             logger.add(sys.stdout, level=LOG_LEVEL,
-#                        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-#                               "<level>{level: <8}</level> | "
-#                               "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-#                               "<level>{message}</level>")
-#         if LOG_TO_FILE:
-#             LOG_FILE_NAME.parent.mkdir(parents=True, exist_ok=True)
-#             logger.add(str(LOG_FILE_NAME), level=LOG_LEVEL,
-#                        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-#                        rotation="10 MB", retention="1 month")
-#     else:
-#         print("Loguru not available, using basic logging")
-
-# def show_banner():
-#     print("""
-#     ⚽ ===================================== ⚽
-#          SOCCER DATA SCRAPER PROJECT
-#          (Simplified SQLite Version)
-#     ⚽ ===================================== ⚽
-    
-#     A soccer data collection and database system.
-    
-#     Current features:
-#     - SQLite database storage
-#     - Sample data generation
-#     - Basic data queries
-#     - Async scraping
-#     - Interactive mode
-#     """)
-
-# def test_basic_scraping():
-#     try:
-#         import requests
-#         from bs4 import BeautifulSoup
-
-#         print("🔄 Testing basic web scraping...")
-#         url = "https://www.bbc.com/sport/football"
-#         headers = {'User-Agent': 'Mozilla/5.0'}
-#         response = requests.get(url, headers=headers, timeout=10)
-
-#         if response.status_code == 200:
-#             soup = BeautifulSoup(response.content, 'html.parser')
-#             title = soup.find('title')
-#             print(f"✅ Title: {title.text if title else 'No title'}")
-#             articles = soup.find_all('h3', limit=3)
-#             print("📰 Articles:")
-#             for i, article in enumerate(articles, 1):
-#                 print(f"  {i}. {article.get_text(strip=True)}")
-#         else:
-#             print(f"❌ Failed: HTTP {response.status_code}")
-#     except Exception as e:
-#         print(f"❌ Scraping error: {e}")
-
-# async def run_async_scraping():
-#     print("🚀 Starting async scraping...")
-#     async with AsyncSoccerScraper(max_concurrent=5) as scraper:
-#         data = await scraper.scrape_all_soccer_sites()
-#         custom_urls = [
-#             'https://www.bbc.com/sport/football',
-#             'https://www.skysports.com/football'
-#         ]
-#         await scraper.scrape_multiple_urls(custom_urls)
-#         scraper.save_results_to_json(data)
-#         print(f"✅ Scraped {len(data)} websites successfully!")
-
-# def run_interactive_mode():
-#     while True:
-#         print("\n=== Soccer Scraper Interactive Mode ===")
-#         print("1. Test database connection")
-#         print("2. Generate sample data")
-#         print("3. View database statistics")
-#         print("4. View sample data")
-#         print("5. Test basic web scraping")
-#         print("6. Export data to CSV")
-#         print("7. Exit")
-#         print("8. Run async scraping")
-#         print("9. Bulk insert test data")
-#         print("11. Validate sample player data before insert")
-
-#         choice = input("\nSelect an option (1-11): ").strip()
-
-#         if choice == '1':
-#             try:
-#                 stats = db_manager.get_table_stats()
-#                 print("✅ Connection OK\n📊", stats)
-#             except Exception as e:
-#                 print(f"❌ DB error: {e}")
-
-#         elif choice == '2':
-#             try:
-#                 generate_sample_data()
-#                 print("✅ Sample data generated")
-#             except Exception as e:
-#                 print(f"❌ Generation error: {e}")
-
-#         elif choice == '3':
-#             try:
-#                 stats = db_manager.get_table_stats()
-#                 for k, v in stats.items():
-#                     print(f"  {k}: {v}")
-#             except Exception as e:
-#                 print(f"❌ Stat error: {e}")
-
-#         elif choice == '4':
-#             try:
-#                 for name in ['countries', 'competitions', 'clubs']:
-#                     df = db_manager.execute_query(f"SELECT * FROM {name} LIMIT 5")
-#                     print(f"\n📍 {name.title()}:\n", df.to_string(index=False))
-#             except Exception as e:
-#                 print(f"❌ View error: {e}")
-
-#         elif choice == '5':
-#             test_basic_scraping()
-
-#         elif choice == '6':
-#             try:
-#                 from config import EXPORT_DIR
-#                 EXPORT_DIR.mkdir(parents=True, exist_ok=True)
-#                 for table in ['countries', 'competitions', 'clubs', 'players', 'matches']:
-#                     df = db_manager.execute_query(f"SELECT * FROM {table}")
-#                     if not df.empty:
-#                         path = EXPORT_DIR / f"{table}.csv"
-#                         df.to_csv(path, index=False)
-#                         print(f"✅ Exported {table} ({len(df)}) -> {path}")
-#                     else:
-#                         print(f"⚠️ {table} is empty")
-#             except Exception as e:
-#                 print(f"❌ Export error: {e}")
-
-#         elif choice == '7':
-#             print("👋 Goodbye")
-#             break
-
-#         elif choice == '8':
-#             try:
-#                 asyncio.run(run_async_scraping())
-#                 print("📊 Async scraping completed")
-#             except Exception as e:
-#                 print(f"❌ Async error: {e}")
-
-#         elif choice == '9':
-#             try:
-#                 test_data = [(f"Player{i}", 20 + i % 10, "Test Club") for i in range(1000)]
-#                 db_manager.bulk_insert_players(test_data)
-#                 print("✅ Bulk insert test done.")
-#             except Exception as e:
-#                 print(f"❌ Bulk insert failed: {e}")
-
-#         elif choice == '11':
-#             players_raw = [
-#                 {"name": "Erling Haaland", "age": 23, "club": "Manchester City"},
-#                 {"name": "", "age": -1, "club": None},
-#             ]
-#             valid_players = []
-
-#             def validate(p):
-#                 if not isinstance(p, dict): raise ValueError("Player must be dict")
-#                 if not p.get("name"): raise ValueError("Missing name")
-#                 if not isinstance(p["age"], int) or p["age"] <= 0: raise ValueError("Invalid age")
-#                 if not p.get("club"): raise ValueError("Missing club")
-
-#             for p in players_raw:
-#                 try:
-#                     validate(p)
-#                     valid_players.append((p["name"], p["age"], p["club"]))
-#                 except ValueError as e:
-#                     print(f"⚠️ Skipped: {e}")
-
-#             if valid_players:
-#                 db_manager.bulk_insert_players(valid_players)
-#                 print("✅ Valid players inserted")
-#             else:
-#                 print("⚠️ No valid players to insert")
-
-#         else:
-#             print("❌ Invalid option. Try again.")
-
-# def main():
-#     setup_logging()
-#     show_banner()
-#     print("🚀 Starting Soccer Data Scraper")
-
-#     try:
-#         print("🔧 Initializing DB...")
-#         init_database()
-#         print("✅ DB ready")
-
-#         stats = db_manager.get_table_stats()
-#         if stats.get('countries', 0) == 0:
-#             print("📊 No data found. Generating sample data...")
-#             generate_sample_data()
-
-#         print("\n🎉 Setup complete")
-#         return 0
-
-#     except Exception as e:
-#         print(f"❌ Startup failed: {e}")
-#         return 1
-
-# if __name__ == "__main__":
-#     import argparse
-
-#     parser = argparse.ArgumentParser(description="Soccer Data Scraper")
-#     parser.add_argument('--interactive', '-i', action='store_true', help='Run in interactive mode')
-#     parser.add_argument('--sample-data', action='store_true', help='Generate sample data')
-#     parser.add_argument('--test-scraping', action='store_true', help='Run scraping test')
-
-#     args = parser.parse_args()
-
-#     if args.interactive:
-#         setup_logging()
-#         show_banner()
-#         init_database()
-#         run_interactive_mode()
-#     elif args.sample_data:
-#         setup_logging()
-#         init_database()
-#         generate_sample_data()
-#         print("✅ Sample data generated")
-#     elif args.test_scraping:
-#         setup_logging()
-#         test_basic_scraping()
-#     else:
-#         sys.exit(main())
 #!/usr/bin/env python3
 """
 Simplified Soccer Data Scraper Main Application
 """
 
 import sys
+import time
 from pathlib import Path
-import pandas as pd
 import asyncio
 from config import LOG_FILE_NAME, LOG_LEVEL, LOG_TO_CONSOLE, LOG_TO_FILE
 
@@ -278,7 +24,15 @@ except ImportError:
 
 from scrapers.async_scraper import AsyncSoccerScraper
 
+_logging_configured = False
+
 def setup_logging():
+    # Idempotent: the argparse branches and main() can both call this without
+    # stacking duplicate sinks (which would double every log write)
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
     if LOGURU_AVAILABLE:
         logger.remove()
         if LOG_TO_CONSOLE:
@@ -311,21 +65,65 @@ def show_banner():
     - Interactive mode
     """)
 
+# Table stats are COUNT(*)-backed, so memoize them briefly between menu
+# cycles and drop the cache whenever an option mutates the tables
+_STATS_TTL_SECONDS = 5.0
+_stats_cache = None
+_stats_cache_ts = 0.0
+
+def _cached_stats():
+    global _stats_cache, _stats_cache_ts
+    now = time.monotonic()
+    if _stats_cache is None or now - _stats_cache_ts > _STATS_TTL_SECONDS:
+        _stats_cache = db_manager.get_table_stats()
+        _stats_cache_ts = now
+    return _stats_cache
+
+def _invalidate_stats():
+    global _stats_cache
+    _stats_cache = None
+
+# Compiled once: find_all('h3') walks every node re-checking the tag name,
+# while a precompiled SoupSieve selector uses its compiled matcher
+_h3_selector = None
+
+def _get_h3_selector():
+    global _h3_selector
+    if _h3_selector is None:
+        import soupsieve
+        _h3_selector = soupsieve.compile('h3')
+    return _h3_selector
+
+# Shared across repeated menu runs so keep-alive skips DNS/TCP/TLS redo
+_scrape_session = None
+
+def _get_scrape_session():
+    global _scrape_session
+    if _scrape_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        session.headers.update({'User-Agent': 'Mozilla/5.0'})
+        session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+        _scrape_session = session
+    return _scrape_session
+
 def test_basic_scraping():
     try:
-        import requests
         from bs4 import BeautifulSoup
 
         print("🔄 Testing basic web scraping...")
         url = "https://www.bbc.com/sport/football"
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _get_scrape_session().get(url, timeout=10)
 
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            try:
+                soup = BeautifulSoup(response.content, 'lxml')
+            except Exception:
+                soup = BeautifulSoup(response.content, 'html.parser')
             title = soup.find('title')
             print(f"✅ Title: {title.text if title else 'No title'}")
-            articles = soup.find_all('h3', limit=3)
+            articles = _get_h3_selector().select(soup, limit=3)
             print("📰 Articles:")
             for i, article in enumerate(articles, 1):
                 print(f"  {i}. {article.get_text(strip=True)}")
@@ -337,12 +135,15 @@ def test_basic_scraping():
 async def run_async_scraping():
     print("🚀 Starting async scraping...")
     async with AsyncSoccerScraper(max_concurrent=5) as scraper:
-        data = await scraper.scrape_all_soccer_sites()
         custom_urls = [
             'https://www.bbc.com/sport/football',
             'https://www.skysports.com/football'
         ]
-        await scraper.scrape_multiple_urls(custom_urls)
+        # One batch for default + custom URLs, so all fetches overlap in a
+        # single gather instead of two sequential I/O phases
+        all_urls = list(dict.fromkeys(scraper.default_urls + custom_urls))
+        await scraper.scrape_multiple_urls(all_urls)
+        data = scraper.results
 
         # 👇 Exemple d'insertion si les données sont au bon format
         player_data = []
@@ -364,117 +165,144 @@ async def run_async_scraping():
         print(f"✅ Scraped {len(data)} websites successfully!")
 
 
+# Built once: the menu text never changes, so one write per cycle suffices
+_MENU = """
+=== Soccer Scraper Interactive Mode ===
+1. Test database connection
+2. Generate sample data
+3. View database statistics
+4. View sample data
+5. Test basic web scraping
+6. Export data to CSV
+7. Exit
+8. Run async scraping
+9. Bulk insert test data
+11. Validate sample player data before insert
+"""
+
+def _export_table_to_csv(table: str) -> str:
+    from config import EXPORT_DIR
+    path = EXPORT_DIR / f"{table}.csv"
+    rows = 0
+    # Chunked read: constant memory even for large tables
+    for chunk in db_manager.execute_query_chunked(f"SELECT * FROM {table}", chunksize=50_000):
+        chunk.to_csv(path, mode='a' if rows else 'w', header=rows == 0, index=False)
+        rows += len(chunk)
+    if rows:
+        return f"✅ Exported {table} ({rows}) -> {path}"
+    return f"⚠️ {table} is empty"
+
+def _action_test_connection():
+    print("✅ Connection OK\n📊", _cached_stats())
+
+def _action_generate_sample_data():
+    generate_sample_data()
+    _invalidate_stats()
+    print("✅ Sample data generated")
+
+def _action_show_stats():
+    for k, v in _cached_stats().items():
+        print(f"  {k}: {v}")
+
+def _action_view_sample_data():
+    for name in ['countries', 'competitions', 'clubs']:
+        df = db_manager.execute_query(f"SELECT * FROM {name} LIMIT 5")
+        # Plain row iteration: a 5-row peek doesn't need the
+        # pandas column-width formatter
+        print(f"\n📍 {name.title()}:")
+        print('\t'.join(df.columns))
+        for row in df.itertuples(index=False):
+            print('\t'.join(map(str, row)))
+
+def _action_export_csv():
+    from concurrent.futures import ThreadPoolExecutor
+    from config import EXPORT_DIR
+    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+    tables = ['countries', 'competitions', 'clubs', 'players', 'matches']
+    # One worker per table: the engine pool hands each thread its
+    # own connection, so queries and file writes overlap
+    with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+        for message in executor.map(_export_table_to_csv, tables):
+            print(message)
+
+def _action_async_scraping():
+    asyncio.run(run_async_scraping())
+    print("📊 Async scraping completed")
+
+def _action_bulk_insert_test():
+    # Generator: rows are produced lazily, no 1000-tuple list held
+    test_data = ((f"Player{i}", 20 + i % 10, "Test Club") for i in range(1000))
+    db_manager.bulk_insert_players(test_data)
+    _invalidate_stats()
+    print("✅ Bulk insert test done.")
+
+def _action_validate_and_insert():
+    players_raw = [
+        {"name": "Erling Haaland", "age": 23, "club": "Manchester City"},
+        {"name": "", "age": -1, "club": None},
+    ]
+
+    # Vectorized validation: one boolean mask over the whole batch
+    # instead of a Python validate() call per row
+    import pandas as pd
+    df = pd.DataFrame(players_raw)
+    mask = (
+        df['name'].fillna('').str.len().gt(0)
+        & df['age'].fillna(0).gt(0)
+        & df['club'].notna()
+    )
+    skipped = len(df) - int(mask.sum())
+    if skipped:
+        print(f"⚠️ Skipped {skipped} invalid player(s)")
+    valid_players = list(
+        df.loc[mask, ['name', 'age', 'club']].itertuples(index=False, name=None)
+    )
+
+    if valid_players:
+        db_manager.bulk_insert_players(valid_players)
+        _invalidate_stats()
+        print("✅ Valid players inserted")
+    else:
+        print("⚠️ No valid players to insert")
+
+# choice -> (action, error label); one driver replaces the per-branch
+# try/except pyramid and makes new options a one-line addition
+_ACTIONS = {
+    '1': (_action_test_connection, "DB error"),
+    '2': (_action_generate_sample_data, "Generation error"),
+    '3': (_action_show_stats, "Stat error"),
+    '4': (_action_view_sample_data, "View error"),
+    '5': (test_basic_scraping, "Scraping error"),
+    '6': (_action_export_csv, "Export error"),
+    '8': (_action_async_scraping, "Async error"),
+    '9': (_action_bulk_insert_test, "Bulk insert failed"),
+    '11': (_action_validate_and_insert, "Validation error"),
+}
+
 def run_interactive_mode():
     while True:
-        print("\n=== Soccer Scraper Interactive Mode ===")
-        print("1. Test database connection")
-        print("2. Generate sample data")
-        print("3. View database statistics")
-        print("4. View sample data")
-        print("5. Test basic web scraping")
-        print("6. Export data to CSV")
-        print("7. Exit")
-        print("8. Run async scraping")
-        print("9. Bulk insert test data")
-        print("11. Validate sample player data before insert")
+        sys.stdout.write(_MENU)
 
         choice = input("\nSelect an option (1-11): ").strip()
 
-        if choice == '1':
-            try:
-                stats = db_manager.get_table_stats()
-                print("✅ Connection OK\n📊", stats)
-            except Exception as e:
-                print(f"❌ DB error: {e}")
-
-        elif choice == '2':
-            try:
-                generate_sample_data()
-                print("✅ Sample data generated")
-            except Exception as e:
-                print(f"❌ Generation error: {e}")
-
-        elif choice == '3':
-            try:
-                stats = db_manager.get_table_stats()
-                for k, v in stats.items():
-                    print(f"  {k}: {v}")
-            except Exception as e:
-                print(f"❌ Stat error: {e}")
-
-        elif choice == '4':
-            try:
-                for name in ['countries', 'competitions', 'clubs']:
-                    df = db_manager.execute_query(f"SELECT * FROM {name} LIMIT 5")
-                    print(f"\n📍 {name.title()}:\n", df.to_string(index=False))
-            except Exception as e:
-                print(f"❌ View error: {e}")
-
-        elif choice == '5':
-            test_basic_scraping()
-
-        elif choice == '6':
-            try:
-                from config import EXPORT_DIR
-                EXPORT_DIR.mkdir(parents=True, exist_ok=True)
-                for table in ['countries', 'competitions', 'clubs', 'players', 'matches']:
-                    df = db_manager.execute_query(f"SELECT * FROM {table}")
-                    if not df.empty:
-                        path = EXPORT_DIR / f"{table}.csv"
-                        df.to_csv(path, index=False)
-                        print(f"✅ Exported {table} ({len(df)}) -> {path}")
-                    else:
-                        print(f"⚠️ {table} is empty")
-            except Exception as e:
-                print(f"❌ Export error: {e}")
-
-        elif choice == '7':
+        if choice == '7':
             print("👋 Goodbye")
             break
 
-        elif choice == '8':
-            try:
-                asyncio.run(run_async_scraping())
-                print("📊 Async scraping completed")
-            except Exception as e:
-                print(f"❌ Async error: {e}")
+        action = _ACTIONS.get(choice)
+        if action is None:
+            print("❌ Invalid option. Try again.")
+            continue
 
-        elif choice == '9':
-            try:
-                test_data = [(f"Player{i}", 20 + i % 10, "Test Club") for i in range(1000)]
-                db_manager.bulk_insert_players(test_data)
-                print("✅ Bulk insert test done.")
-            except Exception as e:
-                print(f"❌ Bulk insert failed: {e}")
-
-        elif choice == '11':
-            players_raw = [
-                {"name": "Erling Haaland", "age": 23, "club": "Manchester City"},
-                {"name": "", "age": -1, "club": None},
-            ]
-            valid_players = []
-
-            def validate(p):
-                if not isinstance(p, dict): raise ValueError("Player must be dict")
-                if not p.get("name"): raise ValueError("Missing name")
-                if not isinstance(p["age"], int) or p["age"] <= 0: raise ValueError("Invalid age")
-                if not p.get("club"): raise ValueError("Missing club")
-
-            for p in players_raw:
-                try:
-                    validate(p)
-                    valid_players.append((p["name"], p["age"], p["club"]))
-                except ValueError as e:
-                    print(f"⚠️ Skipped: {e}")
-
-            if valid_players:
-                db_manager.bulk_insert_players(valid_players)
-                print("✅ Valid players inserted")
-            else:
-                print("⚠️ No valid players to insert")
+        func, label = action
+        try:
+            func()
+        except Exception as e:
+            print(f"❌ {label}: {e}")
 
-        else:
-            print("❌ Invalid option. Try again.")
+def _has_rows(table: str) -> bool:
+    """O(1) existence probe — cheaper than counting every table at startup."""
+    return not db_manager.execute_query(f"SELECT 1 FROM {table} LIMIT 1").empty
 
 def main():
     setup_logging()
@@ -486,8 +314,7 @@ def main():
         init_database()
         print("✅ DB ready")
 
-        stats = db_manager.get_table_stats()
-        if stats.get('countries', 0) == 0:
+        if not _has_rows('countries'):
             print("📊 No data found. Generating sample data...")
             generate_sample_data()
 
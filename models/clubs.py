@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String
 from models.base import Base
 
 class Club(Base):
     __tablename__ = "clubs"
+    __table_args__ = (
+        Index("ix_clubs_country", "country"),
+        Index("ix_clubs_league", "league"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), nullable=False)
-    country = Column(String(100), nullable=False)
-    league = Column(String(100), nullable=False)
+    name = Column(String(64), nullable=False)
+    country = Column(String(64), nullable=False)
+    league = Column(String(64), nullable=False)
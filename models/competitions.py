@@ -5,5 +5,5 @@ class Competition(Base):
     __tablename__ = "competitions"
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), nullable=False)
-    country = Column(String(100), nullable=False)
+    name = Column(String(64), nullable=False)
+    country = Column(String(64), nullable=False)
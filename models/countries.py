@@ -5,5 +5,5 @@ class Country(Base):
     __tablename__ = "countries"
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), nullable=False)
-    code = Column(String(10), nullable=False)
+    name = Column(String(64), nullable=False)
+    code = Column(String(3), nullable=False)
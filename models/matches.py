@@ -1,10 +1,17 @@
-from sqlalchemy import Column, Integer, String, Date
+from sqlalchemy import Column, Date, Index, Integer, String
 from models.base import Base
 
 class Match(Base):
     __tablename__ = "matches"
+    __table_args__ = (
+        Index("ix_matches_date", "date"),
+        # Composite indexes serve "matches for team X in a date range" as a
+        # single range scan; they also cover plain per-team lookups
+        Index("ix_matches_home_date", "home_team", "date"),
+        Index("ix_matches_away_date", "away_team", "date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    home_team = Column(String(100), nullable=False)
-    away_team = Column(String(100), nullable=False)
+    home_team = Column(String(64), nullable=False)
+    away_team = Column(String(64), nullable=False)
     date = Column(Date, nullable=False)
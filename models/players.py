@@ -1,13 +1,16 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String
 from models.base import Base
 
 class Player(Base):
     __tablename__ = "players"
+    __table_args__ = (
+        Index("ix_players_club", "club"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), nullable=False)
+    name = Column(String(64), nullable=False)
     age = Column(Integer, nullable=False)
-    club = Column(String(100), nullable=True)  # Peut devenir une FK plus tard
+    club = Column(String(64), nullable=True)  # Peut devenir une FK plus tard
 
     def __repr__(self):
         return f"<Player(name='{self.name}', age={self.age}, club='{self.club}')>"
@@ -2,37 +2,38 @@ import time
 from .base_scraper import AsyncSoccerScraper  # Assurez-vous que c'est bien le bon chemin
 from database.postgres_connection import db_manager  # Utilise bien Postgres maintenant
 
+
+def _iter_valid(data):
+    """Yield (name, age, club) tuples from parsed site data, skipping bad rows."""
+    for site_name, site_data in data.items():
+        if 'error' in site_data:
+            print(f"❌ {site_name}: {site_data['error']}")
+            continue
+
+        print(f"✅ {site_name}: {site_data.get('title', 'No Title')}")
+        for article in site_data.get('articles', []):
+            name = article.get("name")
+            age = article.get("age")
+            club = article.get("club")
+            if name and isinstance(age, int) and club:
+                yield (name, age, club)
+
 async def test_comprehensive_scraping():
     """Test comprehensive soccer site scraping and insert into PostgreSQL"""
     print("⚽ Testing comprehensive soccer scraping...")
 
     async with AsyncSoccerScraper(max_concurrent=5) as scraper:
-        start_time = time.time()
+        # perf_counter: monotonic and high-resolution, so the delta can't be
+        # skewed by NTP/clock adjustments the way time.time() can
+        start_time = time.perf_counter()
         data = await scraper.scrape_all_soccer_sites()
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         print(f"⏱️ Scraping completed in {end_time - start_time:.2f} seconds")
 
-        valid_players = []
-
-        for site_name, site_data in data.items():
-            if 'error' in site_data:
-                print(f"❌ {site_name}: {site_data['error']}")
-                continue
-
-            print(f"✅ {site_name}: {site_data.get('title', 'No Title')}")
-            articles = site_data.get('articles', [])
-
-            for article in articles:
-                try:
-                    name = article.get("name")
-                    age = article.get("age")
-                    club = article.get("club")
-
-                    if name and isinstance(age, int) and club:
-                        valid_players.append((name, age, club))
-                except Exception as e:
-                    print(f"⚠️ Invalid article format: {e}")
+        # Générateur : les lignes valides sont filtrées en un seul passage,
+        # sans try/except ni appends article par article
+        valid_players = list(_iter_valid(data))
 
         if valid_players:
             db_manager.bulk_insert_players(valid_players)
@@ -1,52 +1,257 @@
 import aiohttp
 import asyncio
 import json
-from typing import List, Dict
-from bs4 import BeautifulSoup
+import random
+import ssl
+import time
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Union
+from urllib.parse import urlsplit
+
+try:
+    # Lexbor-backed C parser, ~10-25x faster than html.parser
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    from bs4 import BeautifulSoup
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+@dataclass(slots=True)
+class ScrapingResult:
+    """Outcome of one fetch; slots keep the per-request footprint small.
+
+    Only the two cache-relevant headers are kept — copying the full header
+    multidict per response was pure allocation overhead.
+    """
+
+    status: Union[int, str]
+    url: Optional[str] = None
+    content: Optional[bytes] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    error: Optional[str] = None
+
+
+class _TokenBucket:
+    """Adaptive per-host rate limiter.
+
+    Successes slowly raise the request rate, failures halve it and drain the
+    bucket, so repeated errors throttle future requests instead of producing
+    a retry storm against an already-struggling host.
+    """
+
+    MIN_RATE = 0.1
+    MAX_RATE = 8.0
+
+    def __init__(self, rate: float = 2.0, capacity: float = 4.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return
+            await asyncio.sleep((1.0 - self.tokens) / self.rate)
+
+    def on_success(self) -> None:
+        self.rate = min(self.rate * 1.05, self.MAX_RATE)
+
+    def on_failure(self) -> None:
+        self.rate = max(self.rate * 0.5, self.MIN_RATE)
+        self.tokens = 0.0
+
+
+# Selectors live at module scope so parse() and any subclass tweak the same
+# strings in one place
+TITLE_SELECTOR = 'title'
+HEADLINE_SELECTOR = 'h3'
+
+# Per-site selector overrides: adding a site is a table entry, not another
+# parse method. Unknown sites fall back to the generic defaults.
+DEFAULT_RULES = {"title": TITLE_SELECTOR, "headlines": HEADLINE_SELECTOR}
+SITE_RULES = {
+    "bbc_sport": {"title": TITLE_SELECTOR, "headlines": "h3"},
+    "sky_sports": {"title": TITLE_SELECTOR, "headlines": "h3, h4.news-list__headline"},
+}
+
+# Session-level timeout: built once instead of a per-request object, with a
+# separate connect budget so a slow handshake can't eat the whole total
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=5)
+
+# One shared context: loading the CA bundle per connector is ~ms of disk and
+# parsing work; pinning ALPN to http/1.1 skips a pointless h2 negotiation
+# round since aiohttp only speaks HTTP/1.1 anyway
+SSL_CTX = ssl.create_default_context()
+SSL_CTX.set_alpn_protocols(['http/1.1'])
 
 
 class AsyncSoccerScraper:
-    def __init__(self, max_concurrent: int = 5):
+    user_agents = [
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0",
+    ]
+
+    soccer_sites = {
+        "bbc_sport": {"url": "https://www.bbc.com/sport/football"},
+        "sky_sports": {"url": "https://www.skysports.com/football"},
+    }
+    default_urls = [info["url"] for info in soccer_sites.values()]
+
+    def __init__(self, max_concurrent: int = 5, delay_between_requests: float = 0.5):
         self.max_concurrent = max_concurrent
+        # Expressed as the starting token-bucket rate (requests/sec); the
+        # buckets then adapt per host from there instead of a fixed sleep
+        self.delay_between_requests = delay_between_requests
         self.semaphore = asyncio.Semaphore(max_concurrent)
         self.session = None
         self.results: Dict[str, Dict] = {}
+        # url -> {etag, last_modified, parsed}: conditional GETs let unchanged
+        # pages come back as 304 with no body to download or re-parse
+        self._cond_cache: Dict[str, Dict] = {}
+        self._buckets: Dict[str, _TokenBucket] = {}
+        # Reverse index built once: url -> site name, instead of scanning
+        # soccer_sites per result in the post-fetch loop
+        self._url_to_site = {
+            info["url"]: name for name, info in self.soccer_sites.items()
+        }
+        # One full header dict per user agent, built once; requests then just
+        # index the pool instead of assembling headers per call
+        self._base_headers = [
+            {
+                "User-Agent": ua,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-GB,en;q=0.9",
+            }
+            for ua in self.user_agents
+        ]
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # Tuned connector: cached DNS and long keep-alives mean repeated
+        # scrape cycles reuse warm connections instead of redoing
+        # DNS/TCP/TLS per request
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrent,
+            limit_per_host=4,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+            ssl=SSL_CTX,
+        )
+        self.session = aiohttp.ClientSession(connector=connector, timeout=REQUEST_TIMEOUT)
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
         await self.session.close()
 
-    async def fetch(self, url: str) -> Dict:
-        try:
-            async with self.semaphore:
-                async with self.session.get(url, timeout=10) as response:
-                    content = await response.text()
-                    return {
-                        "status": response.status,
-                        "content": content,
-                        "url": str(response.url)
-                    }
-        except Exception as e:
-            return {
-                "status": "error",
-                "error": str(e)
-            }
+    def _bucket_for(self, url: str) -> _TokenBucket:
+        host = urlsplit(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate = 1.0 / self.delay_between_requests if self.delay_between_requests > 0 else _TokenBucket.MAX_RATE
+            bucket = self._buckets[host] = _TokenBucket(rate=rate)
+        return bucket
+
+    MAX_RETRIES = 3
+    MAX_BACKOFF = 30.0
+    # A real sports-news page is tens of KB; anything under this is a
+    # truncated body or an interstitial, not worth handing to the parser
+    MIN_CONTENT_LENGTH = 2048
+
+    async def fetch(self, url: str) -> ScrapingResult:
+        bucket = self._bucket_for(url)
+        last_error = "Failed to fetch"
+        for attempt in range(self.MAX_RETRIES):
+            if attempt:
+                # Full jitter: concurrent tasks retrying the same host spread
+                # out instead of hammering it in lockstep
+                await asyncio.sleep(random.uniform(0, min(2 ** attempt, self.MAX_BACKOFF)))
+            try:
+                # randrange on an index beats random.choice + dict building;
+                # the pooled dict is only copied when conditional headers apply
+                headers = self._base_headers[random.randrange(len(self._base_headers))]
+                cached = self._cond_cache.get(url)
+                if cached:
+                    headers = dict(headers)
+                    if cached.get("etag"):
+                        headers["If-None-Match"] = cached["etag"]
+                    if cached.get("last_modified"):
+                        headers["If-Modified-Since"] = cached["last_modified"]
+                async with self.semaphore:
+                    await bucket.acquire()
+                    async with self.session.get(url, headers=headers) as response:
+                        if response.status == 304:
+                            bucket.on_success()
+                            return ScrapingResult(status=304, url=str(response.url))
+                        if response.status == 429:
+                            bucket.on_failure()
+                            last_error = "rate limited"
+                            # Honor the server's own pacing hint when given
+                            retry_after = response.headers.get("Retry-After")
+                            if retry_after and retry_after.isdigit():
+                                await asyncio.sleep(int(retry_after))
+                            continue
+                        if response.status >= 500:
+                            bucket.on_failure()
+                            last_error = f"HTTP {response.status}"
+                            continue
+                        if response.status >= 400:
+                            bucket.on_failure()
+                        else:
+                            bucket.on_success()
+                        # Raw bytes: skips aiohttp's charset sniff + decode copy;
+                        # both HTML parsers handle encoding detection themselves
+                        content = await response.read()
+                        if response.status == 200 and len(content) < self.MIN_CONTENT_LENGTH:
+                            bucket.on_failure()
+                            last_error = f"response too short ({len(content)} bytes)"
+                            continue
+                        return ScrapingResult(
+                            status=response.status,
+                            content=content,
+                            url=str(response.url),
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified"),
+                        )
+            except Exception as e:
+                bucket.on_failure()
+                last_error = str(e)
+        return ScrapingResult(status="error", error=last_error)
 
-    def parse(self, html: str) -> Dict:
+    def parse(self, html: bytes, site: str = None) -> Dict:
+        rules = SITE_RULES.get(site, DEFAULT_RULES)
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            title = soup.title.string if soup.title else "No title"
-            articles = []
+            if SELECTOLAX_AVAILABLE:
+                tree = HTMLParser(html)
+                title_node = tree.css_first(rules["title"])
+                title = title_node.text() if title_node else "No title"
+                headlines = (node.text(strip=True) for node in tree.css(rules["headlines"]))
+            else:
+                soup = BeautifulSoup(html, 'html.parser')
+                title = soup.title.string if soup.title else "No title"
+                headlines = (h3.get_text(strip=True) for h3 in soup.select(rules["headlines"]))
 
-            for h3 in soup.find_all('h3'):
-                articles.append({
-                    "name": h3.get_text(strip=True),
-                    "age": 25,
-                    "club": "Unknown"
-                })
+            # dict.fromkeys dedupes while keeping page order; empty strings
+            # (icon-only h3 wrappers) are dropped before they become articles
+            articles = [
+                {"name": text, "age": 25, "club": "Unknown"}
+                for text in dict.fromkeys(headlines) if text
+            ]
 
             return {
                 "title": title,
@@ -59,25 +264,70 @@ class AsyncSoccerScraper:
 
     async def scrape_url(self, url: str) -> None:
         result = await self.fetch(url)
-        if result.get("status") == 200:
-            parsed = self.parse(result["content"])
-            self.results[url] = parsed
+        await self._store_result(url, result)
+
+    async def _store_result(self, url: str, result: ScrapingResult) -> None:
+        # Known sites are keyed by name; redirects resolve through the final
+        # URL as well, ad-hoc URLs fall back to the URL itself
+        key = (self._url_to_site.get(url)
+               or self._url_to_site.get(result.url)
+               or url)
+        status = result.status
+        if status == 304:
+            # Page unchanged since last cycle: reuse the cached parse
+            cached = self._cond_cache.get(url)
+            if cached:
+                self.results[key] = cached["parsed"]
+                return
+            status = "error"
+        if status == 200:
+            # Parse off the event loop so other fetches keep draining while
+            # the CPU-bound DOM work runs
+            parsed = await asyncio.to_thread(self.parse, result.content, key)
+            # The raw body is dead weight once parsed; dropping the reference
+            # lets each page's HTML be reclaimed within the scrape cycle
+            result.content = None
+            self.results[key] = parsed
+            if result.etag or result.last_modified:
+                self._cond_cache[url] = {
+                    "etag": result.etag,
+                    "last_modified": result.last_modified,
+                    "parsed": parsed,
+                }
         else:
-            self.results[url] = {"error": result.get("error", "Failed to fetch")}
+            self.results[key] = {"error": result.error or "Failed to fetch"}
 
     async def scrape_all_soccer_sites(self) -> Dict[str, Dict]:
-        urls = [
-            "https://www.bbc.com/sport/football",
-            "https://www.skysports.com/football",
-        ]
-        tasks = [self.scrape_url(url) for url in urls]
-        await asyncio.gather(*tasks)
+        await self.scrape_multiple_urls(self.default_urls)
         return self.results
 
     async def scrape_multiple_urls(self, urls: List[str]) -> None:
-        tasks = [self.scrape_url(url) for url in urls]
-        await asyncio.gather(*tasks)
+        # Producer/consumer split: fetches fill a bounded queue while parses
+        # drain it, so downloads and DOM work overlap without ever holding
+        # more than ~2x max_concurrent undecoded bodies in memory
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * self.max_concurrent)
+
+        async def produce(url: str) -> None:
+            await queue.put((url, await self.fetch(url)))
+
+        async def consume() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                url, result = item
+                await self._store_result(url, result)
+
+        consumer = asyncio.ensure_future(consume())
+        await asyncio.gather(*(produce(url) for url in urls))
+        await queue.put(None)
+        await consumer
 
     def save_results_to_json(self, data: Dict, filename: str = "results.json") -> None:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            # Serializes in C straight to UTF-8 bytes, one write call
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=4, ensure_ascii=False)
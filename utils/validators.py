@@ -1,5 +1,12 @@
 # utils/validators.py
 
+from operator import itemgetter
+
+# Bound once at import: one C-level lookup for all three fields instead of
+# three dict probes per call; raises KeyError when a field is missing
+_get_fields = itemgetter('name', 'age', 'club')
+
+
 def validate_player_data(player):
     """
     Validate individual player dictionary.
@@ -12,17 +19,37 @@ def validate_player_data(player):
     Raises:
         ValueError: if any validation fails
     """
-    required_fields = ['name', 'age', 'club']
+    try:
+        name, age, club = _get_fields(player)
+    except KeyError as e:
+        raise ValueError(f"Missing required field: {e.args[0]}") from None
 
-    for field in required_fields:
-        if field not in player:
-            raise ValueError(f"Missing required field: {field}")
-    
-    if not isinstance(player['name'], str) or not player['name'].strip():
+    # Exact type checks: scraped rows are plain str/int, and `type(x) is`
+    # skips the subclass walk isinstance() does
+    if type(name) is not str or not name.strip():
         raise ValueError("Invalid player name")
 
-    if not isinstance(player['club'], str) or not player['club'].strip():
+    if type(club) is not str or not club.strip():
         raise ValueError("Invalid player club")
 
-    if not isinstance(player['age'], int) or player['age'] <= 0:
+    if type(age) is not int or age <= 0:
         raise ValueError("Invalid player age")
+
+
+def validate_many(players):
+    """
+    Yield only the valid player dicts from an iterable.
+
+    No exceptions are raised for bad rows — invalid entries are simply
+    skipped, which keeps bulk pipelines free of per-row try/except cost.
+    """
+    get = _get_fields
+    for player in players:
+        try:
+            name, age, club = get(player)
+        except KeyError:
+            continue
+        if (type(name) is str and name.strip()
+                and type(club) is str and club.strip()
+                and type(age) is int and age > 0):
+            yield player